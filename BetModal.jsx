@@ -15,10 +15,13 @@ const BetModal = ({ isOpen, onClose, event, bettingOption }) => {
   const [amount, setAmount] = useState('')
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState('')
+  // The price shown to the user; sent with the bet so the server can refuse
+  // it if the odds have moved since
+  const [odds, setOdds] = useState(bettingOption.odds)
   const { user, updateBalance } = useAuth()
 
-  const potentialPayout = amount ? (parseFloat(amount) * bettingOption.odds).toFixed(2) : '0.00'
-  const potentialProfit = amount ? (parseFloat(amount) * (bettingOption.odds - 1)).toFixed(2) : '0.00'
+  const potentialPayout = amount ? (parseFloat(amount) * odds).toFixed(2) : '0.00'
+  const potentialProfit = amount ? (parseFloat(amount) * (odds - 1)).toFixed(2) : '0.00'
 
   const quickAmounts = [10, 25, 50, 100]
 
@@ -50,7 +53,8 @@ const BetModal = ({ isOpen, onClose, event, bettingOption }) => {
         credentials: 'include',
         body: JSON.stringify({
           betting_option_id: bettingOption.id,
-          amount: parseFloat(amount)
+          amount: parseFloat(amount),
+          odds
         }),
       })
 
@@ -60,6 +64,10 @@ const BetModal = ({ isOpen, onClose, event, bettingOption }) => {
         onClose()
         // Show success message
         alert('Bet placed successfully!')
+      } else if (response.status === 409) {
+        const errorData = await response.json()
+        setOdds(errorData.odds)
+        setError(`Odds changed to ${errorData.odds.toFixed(2)}. Check your bet and place it again.`)
       } else {
         const errorData = await response.json()
         setError(errorData.error || 'Failed to place bet')
@@ -103,7 +111,7 @@ const BetModal = ({ isOpen, onClose, event, bettingOption }) => {
             <div className="flex items-center justify-between">
               <span className="text-gray-300">{getOptionLabel()}</span>
               <span className="text-lg font-bold text-green-400">
-                {bettingOption.odds.toFixed(2)}
+                {odds.toFixed(2)}
               </span>
             </div>
           </div>
@@ -26,25 +26,13 @@ const Home = () => {
 
   const fetchHomeData = async () => {
     try {
-      const [featuredRes, liveRes, popularRes] = await Promise.all([
-        fetch('/api/events?status=upcoming&limit=6'),
-        fetch('/api/events/live'),
-        fetch('/api/events/popular')
-      ])
+      const response = await fetch('/api/bundles/home')
 
-      if (featuredRes.ok) {
-        const featured = await featuredRes.json()
-        setFeaturedEvents(featured)
-      }
-
-      if (liveRes.ok) {
-        const live = await liveRes.json()
-        setLiveEvents(live)
-      }
-
-      if (popularRes.ok) {
-        const popular = await popularRes.json()
-        setPopularEvents(popular)
+      if (response.ok) {
+        const bundle = await response.json()
+        setFeaturedEvents(bundle.featured)
+        setLiveEvents(bundle.live)
+        setPopularEvents(bundle.popular)
       }
     } catch (error) {
       console.error('Failed to fetch home data:', error)
@@ -36,25 +36,13 @@ const Profile = () => {
 
   const fetchUserData = async () => {
     try {
-      const [betsRes, transactionsRes, statsRes] = await Promise.all([
-        fetch('/api/my-bets', { credentials: 'include' }),
-        fetch('/api/transaction-history', { credentials: 'include' }),
-        fetch('/api/betting-stats', { credentials: 'include' })
-      ])
+      const response = await fetch('/api/bundles/profile', { credentials: 'include' })
 
-      if (betsRes.ok) {
-        const betsData = await betsRes.json()
-        setBets(betsData)
-      }
-
-      if (transactionsRes.ok) {
-        const transactionsData = await transactionsRes.json()
-        setTransactions(transactionsData.transactions || [])
-      }
-
-      if (statsRes.ok) {
-        const statsData = await statsRes.json()
-        setStats(statsData)
+      if (response.ok) {
+        const bundle = await response.json()
+        setBets(bundle.bets)
+        setTransactions(bundle.transactions.transactions || [])
+        setStats(bundle.betting_stats)
       }
     } catch (error) {
       console.error('Failed to fetch user data:', error)
@@ -24,19 +24,12 @@ const Sports = () => {
 
   const fetchSportsAndEvents = async () => {
     try {
-      const [sportsRes, eventsRes] = await Promise.all([
-        fetch('/api/sports'),
-        fetch('/api/events?status=upcoming&limit=50')
-      ])
-
-      if (sportsRes.ok) {
-        const sportsData = await sportsRes.json()
-        setSports(sportsData)
-      }
+      const response = await fetch('/api/bundles/sports')
 
-      if (eventsRes.ok) {
-        const eventsData = await eventsRes.json()
-        setEvents(eventsData)
+      if (response.ok) {
+        const bundle = await response.json()
+        setSports(bundle.sports)
+        setEvents(bundle.events)
       }
     } catch (error) {
       console.error('Failed to fetch data:', error)
@@ -0,0 +1,80 @@
+from sqlalchemy.exc import IntegrityError
+from src.models.user import db
+from src.models.betting import Bet, MultiBet, BetStats
+
+# Per-user bet statistics live in BetStats and are adjusted in place on every
+# placement and settlement of single and multi bets, so reading them never
+# scans Bet or MultiBet.
+
+def rebuild_bet_stats(user_id):
+    # One grouped pass over the user's single bets and one over their multi
+    # bets, only needed the first time a user's rollup is read (e.g. bets
+    # placed before the rollup existed). A won single bet returns its
+    # potential payout; a settled multi bet records what it actually paid.
+    grouped = [
+        db.session.query(
+            Bet.status,
+            db.func.count(Bet.id),
+            db.func.sum(Bet.amount),
+            db.func.sum(Bet.potential_payout),
+            db.func.max(Bet.potential_payout)
+        ).filter(Bet.user_id == user_id).group_by(Bet.status).all(),
+        db.session.query(
+            MultiBet.status,
+            db.func.count(MultiBet.id),
+            db.func.sum(MultiBet.amount),
+            db.func.sum(MultiBet.payout),
+            db.func.max(MultiBet.payout)
+        ).filter(MultiBet.user_id == user_id).group_by(MultiBet.status).all()
+    ]
+
+    stats = BetStats(
+        user_id=user_id, total_bets=0, pending_bets=0, won_bets=0, lost_bets=0,
+        cancelled_bets=0, total_staked=0.0, total_returned=0.0, biggest_win=0.0
+    )
+    for rows in grouped:
+        for status, count, staked, payout, top_payout in rows:
+            stats.total_bets += count
+            if status == 'cancelled':
+                stats.cancelled_bets += count
+                continue
+            stats.total_staked += staked or 0
+            if status == 'pending':
+                stats.pending_bets += count
+            elif status == 'won':
+                stats.won_bets += count
+                stats.total_returned += payout or 0
+                stats.biggest_win = max(stats.biggest_win, top_payout or 0)
+            elif status == 'lost':
+                stats.lost_bets += count
+
+    db.session.add(stats)
+    db.session.flush()
+    return stats
+
+def load_bet_stats(user_id):
+    stats = BetStats.query.get(user_id)
+    if stats is None:
+        # A concurrent first request may insert the row first; the savepoint
+        # keeps that conflict from aborting the caller's transaction
+        try:
+            with db.session.begin_nested():
+                stats = rebuild_bet_stats(user_id)
+        except IntegrityError:
+            stats = BetStats.query.get(user_id)
+    return stats
+
+def bump_bet_stats(user_id, biggest_win=None, **deltas):
+    # Increments are applied in SQL so concurrent requests don't lose updates.
+    # The user's BetStats row must already exist (see load_bet_stats).
+    values = {
+        getattr(BetStats, column): getattr(BetStats, column) + delta
+        for column, delta in deltas.items() if delta
+    }
+    if biggest_win:
+        values[BetStats.biggest_win] = db.case(
+            (BetStats.biggest_win < biggest_win, biggest_win),
+            else_=BetStats.biggest_win
+        )
+    if values:
+        BetStats.query.filter_by(user_id=user_id).update(values, synchronize_session=False)
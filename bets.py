@@ -0,0 +1,270 @@
+from flask import Blueprint, jsonify, request, session
+from sqlalchemy.orm import joinedload
+from src.models.user import User, db
+from src.models.betting import Event, BettingOption, Bet, Transaction
+from src.services.bet_stats import load_bet_stats, bump_bet_stats
+from src.services.bundle_cache import clear_bundle_cache
+from src.services.exposure import exposure_engine
+from src.services.pricing import pricing_engine
+from src.routes.multibets import settle_multi_bet_legs
+from src.services.idempotency import idempotent
+from datetime import datetime
+
+betting_bp = Blueprint('betting', __name__)
+
+def list_user_bets(user_id, limit=50, before_placed_at=None, before_id=None):
+    # Served newest first from the (user_id, placed_at) index; pages continue
+    # from the last bet returned instead of using OFFSET
+    query = db.session.query(Bet, BettingOption, Event).join(
+        BettingOption, Bet.betting_option_id == BettingOption.id
+    ).join(
+        Event, BettingOption.event_id == Event.id
+    ).options(
+        joinedload(Event.sport)
+    ).filter(Bet.user_id == user_id)
+
+    if before_placed_at is not None:
+        if before_id is not None:
+            # Row-value comparison, so the index seeks on placed_at as well
+            query = query.filter(
+                db.tuple_(Bet.placed_at, Bet.id) < (before_placed_at, before_id)
+            )
+        else:
+            query = query.filter(Bet.placed_at < before_placed_at)
+
+    rows = query.order_by(Bet.placed_at.desc(), Bet.id.desc()).limit(limit).all()
+
+    bets = []
+    for bet, option, event in rows:
+        bet_data = bet.to_dict()
+        bet_data['betting_option'] = option.to_dict()
+        bet_data['event'] = event.to_dict()
+        bets.append(bet_data)
+    return bets
+
+@betting_bp.route('/place-bet', methods=['POST'])
+@idempotent
+def place_bet():
+    try:
+        user_id = session.get('user_id')
+        if not user_id:
+            return jsonify({'error': 'Not authenticated'}), 401
+
+        data = request.json
+        amount = float(data['amount'])
+
+        if amount <= 0:
+            return jsonify({'error': 'Invalid bet amount'}), 400
+
+        option = BettingOption.query.get(data['betting_option_id'])
+        if not option or not option.is_active:
+            return jsonify({'error': 'Betting option not available'}), 400
+
+        if option.event.status not in ('upcoming', 'live'):
+            return jsonify({'error': 'Event is closed for betting'}), 400
+
+        # Odds move on every repricing tick; never settle at a price the
+        # client didn't show
+        if 'odds' in data and round(float(data['odds']), 2) != option.odds:
+            return jsonify({'error': 'Odds changed', 'odds': option.odds}), 409
+
+        user = User.query.get(user_id)
+        if not user:
+            return jsonify({'error': 'User not found'}), 404
+
+        if user.balance < amount:
+            return jsonify({'error': 'Insufficient balance'}), 400
+
+        # Make sure the rollup exists before the new bet is added, so a
+        # first-time rebuild doesn't count it twice
+        load_bet_stats(user_id)
+
+        user.balance -= amount
+        potential_payout = round(amount * option.odds, 2)
+        market = (option.event_id, option.id, option.option_type)
+
+        bet = Bet(
+            user_id=user_id,
+            betting_option_id=option.id,
+            amount=amount,
+            odds=option.odds,
+            potential_payout=potential_payout
+        )
+
+        transaction = Transaction(
+            user_id=user_id,
+            transaction_type='bet',
+            amount=-amount,
+            description=f'Bet on {option.event.home_team} vs {option.event.away_team}'
+        )
+
+        db.session.add(bet)
+        db.session.add(transaction)
+        bump_bet_stats(user_id, total_bets=1, pending_bets=1, total_staked=amount)
+        db.session.commit()
+
+        exposure_engine.record_bet(*market, amount, potential_payout)
+        pricing_engine.record_bet(market[0], market[1], amount)
+
+        return jsonify({
+            'message': 'Bet placed successfully',
+            'new_balance': user.balance,
+            'bet': bet.to_dict()
+        }), 201
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@betting_bp.route('/my-bets', methods=['GET'])
+def get_my_bets():
+    try:
+        user_id = session.get('user_id')
+        if not user_id:
+            return jsonify({'error': 'Not authenticated'}), 401
+
+        limit = min(request.args.get('limit', 50, type=int), 100)
+        before = request.args.get('before')
+        before_id = request.args.get('before_id', type=int)
+        before_placed_at = datetime.fromisoformat(before) if before else None
+
+        return jsonify(list_user_bets(user_id, limit, before_placed_at, before_id)), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@betting_bp.route('/betting-stats', methods=['GET'])
+def get_betting_stats():
+    try:
+        user_id = session.get('user_id')
+        if not user_id:
+            return jsonify({'error': 'Not authenticated'}), 401
+
+        stats = load_bet_stats(user_id)
+        db.session.commit()
+
+        return jsonify(stats.to_dict()), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@betting_bp.route('/admin/events/<int:event_id>/settle', methods=['POST'])
+def settle_event(event_id):
+    try:
+        event = Event.query.get_or_404(event_id)
+        data = request.json or {}
+
+        cancelled = data.get('status') == 'cancelled'
+        winning_option_ids = set(data.get('winning_option_ids', []))
+
+        pending = db.session.query(Bet).join(
+            BettingOption, Bet.betting_option_id == BettingOption.id
+        ).filter(
+            BettingOption.event_id == event_id,
+            Bet.status == 'pending'
+        ).all()
+
+        # Rollups must exist before any bet changes status
+        for user_id in {bet.user_id for bet in pending}:
+            load_bet_stats(user_id)
+
+        won_ids, lost_ids, cancelled_ids = [], [], []
+        per_user = {}
+        transactions = []
+        for bet in pending:
+            deltas = per_user.setdefault(bet.user_id, {
+                'pending_bets': 0, 'won_bets': 0, 'lost_bets': 0, 'cancelled_bets': 0,
+                'total_staked': 0.0, 'total_returned': 0.0, 'credit': 0.0, 'biggest_win': 0.0
+            })
+            deltas['pending_bets'] -= 1
+            if cancelled:
+                cancelled_ids.append(bet.id)
+                deltas['cancelled_bets'] += 1
+                deltas['total_staked'] -= bet.amount
+                deltas['credit'] += bet.amount
+                transactions.append(Transaction(
+                    user_id=bet.user_id,
+                    transaction_type='payout',
+                    amount=bet.amount,
+                    description=f'Refund for cancelled bet #{bet.id}'
+                ))
+            elif bet.betting_option_id in winning_option_ids:
+                won_ids.append(bet.id)
+                deltas['won_bets'] += 1
+                deltas['total_returned'] += bet.potential_payout
+                deltas['credit'] += bet.potential_payout
+                deltas['biggest_win'] = max(deltas['biggest_win'], bet.potential_payout)
+                transactions.append(Transaction(
+                    user_id=bet.user_id,
+                    transaction_type='payout',
+                    amount=bet.potential_payout,
+                    description=f'Payout for bet #{bet.id}'
+                ))
+            else:
+                lost_ids.append(bet.id)
+                deltas['lost_bets'] += 1
+
+        now = datetime.utcnow()
+        for status, ids in (('won', won_ids), ('lost', lost_ids), ('cancelled', cancelled_ids)):
+            if ids:
+                Bet.query.filter(Bet.id.in_(ids)).update(
+                    {Bet.status: status, Bet.settled_at: now},
+                    synchronize_session=False
+                )
+
+        for user_id, deltas in per_user.items():
+            credit = deltas.pop('credit')
+            if credit:
+                User.query.filter_by(id=user_id).update(
+                    {User.balance: User.balance + credit},
+                    synchronize_session=False
+                )
+            bump_bet_stats(user_id, **deltas)
+
+        db.session.add_all(transactions)
+
+        multi_bets_settled = settle_multi_bet_legs(event_id, winning_option_ids, cancelled)
+
+        event.status = 'cancelled' if cancelled else 'finished'
+        if 'home_score' in data:
+            event.home_score = data['home_score']
+        if 'away_score' in data:
+            event.away_score = data['away_score']
+        BettingOption.query.filter_by(event_id=event_id).update(
+            {BettingOption.is_active: False},
+            synchronize_session=False
+        )
+
+        db.session.commit()
+
+        exposure_engine.clear_event(event_id)
+        pricing_engine.clear_event(event_id)
+        clear_bundle_cache()
+
+        return jsonify({
+            'event': event.to_dict(),
+            'won': len(won_ids),
+            'lost': len(lost_ids),
+            'cancelled': len(cancelled_ids),
+            'multi_bets_settled': multi_bets_settled
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@betting_bp.route('/admin/exposure', methods=['GET'])
+def get_exposure_summary():
+    try:
+        limit = request.args.get('limit', 50, type=int)
+        return jsonify(exposure_engine.summary(limit)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@betting_bp.route('/admin/exposure/<int:event_id>', methods=['GET'])
+def get_event_exposure(event_id):
+    try:
+        return jsonify(exposure_engine.event_exposure(event_id)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
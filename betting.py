@@ -76,6 +76,11 @@ class Bet(db.Model):
     status = db.Column(db.String(20), default='pending')  # pending, won, lost, cancelled
     placed_at = db.Column(db.DateTime, default=datetime.utcnow)
     settled_at = db.Column(db.DateTime)
+    
+    # Keyset index for a user's bet history, newest first
+    __table_args__ = (
+        db.Index('ix_bet_user_id_placed_at', 'user_id', 'placed_at'),
+    )
 
     def to_dict(self):
         return {
@@ -90,6 +95,91 @@ class Bet(db.Model):
             'settled_at': self.settled_at.isoformat() if self.settled_at else None
         }
 
+class MultiBet(db.Model):
+    # Accumulator (all legs must win) or system bet (every k-leg combination
+    # of the n legs is a separate accumulator staked with unit_stake)
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    bet_type = db.Column(db.String(20), nullable=False)  # accumulator, system
+    system_size = db.Column(db.Integer, nullable=False)  # k legs per combination
+    combinations = db.Column(db.Integer, nullable=False)
+    amount = db.Column(db.Float, nullable=False)
+    unit_stake = db.Column(db.Float, nullable=False)
+    combined_odds = db.Column(db.Float, nullable=False)
+    potential_payout = db.Column(db.Float, nullable=False)
+    payout = db.Column(db.Float)
+    status = db.Column(db.String(20), default='pending')  # pending, won, lost, cancelled
+    placed_at = db.Column(db.DateTime, default=datetime.utcnow)
+    settled_at = db.Column(db.DateTime)
+    
+    # Relationships
+    legs = db.relationship('MultiBetLeg', backref='multi_bet', lazy=True)
+    
+    __table_args__ = (
+        db.Index('ix_multi_bet_user_id_placed_at', 'user_id', 'placed_at'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'bet_type': self.bet_type,
+            'system_size': self.system_size,
+            'combinations': self.combinations,
+            'amount': self.amount,
+            'unit_stake': self.unit_stake,
+            'combined_odds': self.combined_odds,
+            'potential_payout': self.potential_payout,
+            'payout': self.payout,
+            'status': self.status,
+            'placed_at': self.placed_at.isoformat() if self.placed_at else None,
+            'settled_at': self.settled_at.isoformat() if self.settled_at else None
+        }
+
+class MultiBetLeg(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    multi_bet_id = db.Column(db.Integer, db.ForeignKey('multi_bet.id'), nullable=False)
+    betting_option_id = db.Column(db.Integer, db.ForeignKey('betting_option.id'), nullable=False, index=True)
+    odds = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(20), default='pending')  # pending, won, lost, void
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'multi_bet_id': self.multi_bet_id,
+            'betting_option_id': self.betting_option_id,
+            'odds': self.odds,
+            'status': self.status
+        }
+
+class BetStats(db.Model):
+    # Per-user rollup of Bet, kept up to date on placement and settlement
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    total_bets = db.Column(db.Integer, nullable=False, default=0)
+    pending_bets = db.Column(db.Integer, nullable=False, default=0)
+    won_bets = db.Column(db.Integer, nullable=False, default=0)
+    lost_bets = db.Column(db.Integer, nullable=False, default=0)
+    cancelled_bets = db.Column(db.Integer, nullable=False, default=0)
+    total_staked = db.Column(db.Float, nullable=False, default=0.0)  # excludes refunded stakes
+    total_returned = db.Column(db.Float, nullable=False, default=0.0)  # payouts of won bets
+    biggest_win = db.Column(db.Float, nullable=False, default=0.0)
+
+    def to_dict(self):
+        settled = self.won_bets + self.lost_bets
+        return {
+            'total_bets': self.total_bets,
+            'pending_bets': self.pending_bets,
+            'won_bets': self.won_bets,
+            'lost_bets': self.lost_bets,
+            'cancelled_bets': self.cancelled_bets,
+            'win_rate': round(self.won_bets / settled * 100, 1) if settled else 0,
+            'total_staked': self.total_staked,
+            'total_returned': self.total_returned,
+            'total_winnings': self.total_returned,
+            'net_profit': self.total_returned - self.total_staked,
+            'biggest_win': self.biggest_win
+        }
+
 class Transaction(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -111,3 +201,19 @@ class Transaction(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+
+class IdempotencyKey(db.Model):
+    # Stored response of a money endpoint, replayed when a client retries
+    # with the same Idempotency-Key
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    key = db.Column(db.String(64), nullable=False)
+    endpoint = db.Column(db.String(50), nullable=False)
+    request_hash = db.Column(db.String(64), nullable=False)  # sha256 of the request body
+    status_code = db.Column(db.Integer)  # NULL while the first request is still running
+    response = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'key', name='uq_idempotency_key_user_id_key'),
+    )
@@ -0,0 +1,36 @@
+import threading
+import time
+
+# Anonymous bundles (src.routes.bundles) are identical for every visitor, so
+# they are served from memory for a few seconds instead of being rebuilt on
+# each page view. Admin writes that change the event lists clear the cache so
+# new and settled events show up immediately; odds changes are left to expire
+# with the TTL.
+
+ANONYMOUS_BUNDLE_TTL = 5  # seconds
+
+_bundle_cache = {}
+_bundle_cache_lock = threading.Lock()
+# Bumped by every clear, so a build that started before a write is not stored
+# over the cleared cache
+_bundle_generation = 0
+
+def cached_bundle(key, build):
+    now = time.monotonic()
+    with _bundle_cache_lock:
+        entry = _bundle_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        generation = _bundle_generation
+
+    payload = build()
+    with _bundle_cache_lock:
+        if generation == _bundle_generation:
+            _bundle_cache[key] = (now + ANONYMOUS_BUNDLE_TTL, payload)
+    return payload
+
+def clear_bundle_cache():
+    global _bundle_generation
+    with _bundle_cache_lock:
+        _bundle_cache.clear()
+        _bundle_generation += 1
@@ -0,0 +1,63 @@
+from flask import Blueprint, jsonify, session
+from src.models.user import User, db
+from src.routes.sports import list_active_sports, list_events, list_live_events, list_popular_events
+from src.routes.transactions import build_transaction_page, build_wallet_summary
+from src.routes.bets import list_user_bets
+from src.services.bet_stats import load_bet_stats
+from src.services.bundle_cache import cached_bundle
+
+bundles_bp = Blueprint('bundles', __name__)
+
+def build_home_bundle():
+    return {
+        'featured': list_events('upcoming', 6),
+        'live': list_live_events(),
+        'popular': list_popular_events()
+    }
+
+def build_sports_bundle():
+    return {
+        'sports': list_active_sports(),
+        'events': list_events('upcoming', 50)
+    }
+
+@bundles_bp.route('/bundles/home', methods=['GET'])
+def get_home_bundle():
+    try:
+        return jsonify(cached_bundle('home', build_home_bundle)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bundles_bp.route('/bundles/sports', methods=['GET'])
+def get_sports_bundle():
+    try:
+        return jsonify(cached_bundle('sports', build_sports_bundle)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bundles_bp.route('/bundles/profile', methods=['GET'])
+def get_profile_bundle():
+    try:
+        user_id = session.get('user_id')
+        if not user_id:
+            return jsonify({'error': 'Not authenticated'}), 401
+
+        # The user is looked up once and shared by every section of the bundle
+        user = User.query.get(user_id)
+        if not user:
+            return jsonify({'error': 'User not found'}), 404
+
+        bundle = {
+            'user': user.to_dict(),
+            'bets': list_user_bets(user.id),
+            'betting_stats': load_bet_stats(user.id).to_dict(),
+            'transactions': build_transaction_page(user.id),
+            'wallet_summary': build_wallet_summary(user)
+        }
+        db.session.commit()
+
+        return jsonify(bundle), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
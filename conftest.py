@@ -0,0 +1,18 @@
+import pytest
+from db_fixtures import create_test_app
+from src.models.user import db
+
+# Every test gets its own clone of the seeded template (see db_fixtures.py) and
+# a fresh copy of the services' in-memory state.
+
+@pytest.fixture
+def app():
+    app = create_test_app()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+import hashlib
+import os
+import random
+import sqlite3
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+
+from datetime import datetime, timedelta
+from flask import Flask
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+from src.models.user import User, db
+from src.models.betting import Sport, Event, BettingOption, Bet, BetStats, Transaction
+
+# Seeded SQLite templates for tests and benchmarks.
+#
+# The schema and sample data are built once into a template file keyed by a
+# hash of the current schema and the seed. Each test or benchmark then gets its
+# own copy through the SQLite backup API (to a file or to :memory:) instead of
+# running create_all and re-inserting rows. Changing a model changes the hash,
+# so a stale template is never reused.
+#
+#     conn = clone_template()              # sqlite3 connection to :memory:
+#     clone_template('/tmp/bench.db')      # file copy for a benchmark run
+#     app = create_test_app()              # Flask app bound to a fresh clone
+#
+# conftest.py wraps create_test_app() in pytest fixtures, one clone per test.
+#
+# python db_fixtures.py [seed] prebuilds the template.
+
+TEMPLATE_DIR = os.environ.get(
+    'DB_TEMPLATE_DIR',
+    os.path.join(os.path.dirname(__file__), '.db_templates')
+)
+DEFAULT_SEED = 42
+
+# Bump when seed_database() changes, so old templates are rebuilt
+DATASET_VERSION = 1
+
+SPORTS = ['Football', 'Basketball', 'Tennis', 'Baseball', 'Hockey', 'Boxing', 'MMA', 'Cricket']
+OPTION_VALUES = [('win', 'home'), ('win', 'away'), ('win', 'draw')]
+
+def schema_hash():
+    dialect = sqlite.dialect()
+    ddl = []
+    for table in db.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda index: index.name)
+        )
+    ddl.append(f'dataset-version {DATASET_VERSION}')
+    return hashlib.sha256('\n'.join(ddl).encode()).hexdigest()[:16]
+
+def template_path(seed=DEFAULT_SEED):
+    return os.path.join(TEMPLATE_DIR, f'template-{schema_hash()}-{seed}.db')
+
+def seed_database(seed=DEFAULT_SEED, users=50, events=200, bets_per_user=20):
+    # Deterministic for a given seed; rows go in as one executemany per table
+    rng = random.Random(seed)
+    now = datetime(2025, 1, 1)
+
+    db.session.execute(db.insert(Sport), [
+        {'id': i, 'name': name, 'icon': '', 'is_active': True}
+        for i, name in enumerate(SPORTS, start=1)
+    ])
+
+    event_rows, option_rows = [], []
+    for event_id in range(1, events + 1):
+        event_rows.append({
+            'id': event_id,
+            'sport_id': rng.randint(1, len(SPORTS)),
+            'home_team': f'Team {rng.randint(1, 500)}',
+            'away_team': f'Team {rng.randint(501, 1000)}',
+            'start_time': now + timedelta(hours=rng.randint(-48, 240)),
+            'status': rng.choice(['upcoming', 'upcoming', 'upcoming', 'live']),
+            'home_score': 0,
+            'away_score': 0
+        })
+        for option_type, option_value in OPTION_VALUES:
+            option_rows.append({
+                'id': len(option_rows) + 1,
+                'event_id': event_id,
+                'option_type': option_type,
+                'option_value': option_value,
+                'odds': round(rng.uniform(1.3, 5.0), 2),
+                'is_active': True
+            })
+    db.session.execute(db.insert(Event), event_rows)
+    db.session.execute(db.insert(BettingOption), option_rows)
+
+    # Hash the password once and reuse the resulting row for every user
+    prototype = User(username='prototype', email='prototype@example.com', balance=0.0)
+    prototype.set_password('password')
+    user_defaults = {
+        column.key: getattr(prototype, column.key)
+        for column in User.__table__.columns if column.key != 'id'
+    }
+
+    user_rows, bet_rows, stats_rows, transaction_rows = [], [], [], []
+    for user_id in range(1, users + 1):
+        balance = 1000.0
+        transaction_rows.append({
+            'user_id': user_id, 'transaction_type': 'deposit', 'amount': 1000.0,
+            'description': 'Welcome bonus', 'created_at': now - timedelta(days=30)
+        })
+        stats = {
+            'user_id': user_id, 'total_bets': 0, 'pending_bets': 0, 'won_bets': 0,
+            'lost_bets': 0, 'cancelled_bets': 0, 'total_staked': 0.0,
+            'total_returned': 0.0, 'biggest_win': 0.0
+        }
+        for _ in range(bets_per_user):
+            option = rng.choice(option_rows)
+            amount = float(rng.randint(1, 20))
+            payout = round(amount * option['odds'], 2)
+            status = rng.choice(['pending', 'won', 'lost', 'lost'])
+            placed_at = now - timedelta(minutes=rng.randint(1, 60 * 24 * 30))
+            bet_rows.append({
+                'user_id': user_id,
+                'betting_option_id': option['id'],
+                'amount': amount,
+                'odds': option['odds'],
+                'potential_payout': payout,
+                'status': status,
+                'placed_at': placed_at,
+                'settled_at': None if status == 'pending' else placed_at + timedelta(hours=2)
+            })
+            transaction_rows.append({
+                'user_id': user_id, 'transaction_type': 'bet', 'amount': -amount,
+                'description': 'Bet', 'created_at': placed_at
+            })
+            balance -= amount
+            stats['total_bets'] += 1
+            stats[f'{status}_bets'] += 1
+            stats['total_staked'] += amount
+            if status == 'won':
+                balance += payout
+                stats['total_returned'] += payout
+                stats['biggest_win'] = max(stats['biggest_win'], payout)
+                transaction_rows.append({
+                    'user_id': user_id, 'transaction_type': 'payout', 'amount': payout,
+                    'description': 'Payout', 'created_at': placed_at + timedelta(hours=2)
+                })
+        user_rows.append(dict(
+            user_defaults, id=user_id, username=f'user{user_id}',
+            email=f'user{user_id}@example.com', balance=round(balance, 2)
+        ))
+        stats_rows.append(stats)
+
+    db.session.execute(db.insert(User), user_rows)
+    db.session.execute(db.insert(Bet), bet_rows)
+    db.session.execute(db.insert(BetStats), stats_rows)
+    db.session.execute(db.insert(Transaction), transaction_rows)
+    db.session.commit()
+
+def build_template(seed=DEFAULT_SEED):
+    path = template_path(seed)
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(TEMPLATE_DIR, exist_ok=True)
+    # Build under a private name and rename, so parallel workers never see a
+    # half-written template
+    building = f'{path}.{os.getpid()}.tmp'
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{building}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        seed_database(seed)
+        db.session.remove()
+        db.engine.dispose()
+
+    os.replace(building, path)
+    return path
+
+def clone_template(target=':memory:', seed=DEFAULT_SEED):
+    source = sqlite3.connect(build_template(seed))
+    clone = sqlite3.connect(target, check_same_thread=False)
+    try:
+        source.backup(clone)
+    finally:
+        source.close()
+    return clone
+
+def create_test_app(seed=DEFAULT_SEED, target=':memory:'):
+    # Same blueprints as src.main, but bound to a private clone and without
+    # the background repricing thread
+    from src.routes.user import user_bp
+    from src.routes.auth import auth_bp
+    from src.routes.sports import sports_bp
+    from src.routes.bets import betting_bp
+    from src.routes.transactions import transactions_bp
+    from src.routes.bundles import bundles_bp
+    from src.routes.multibets import multibets_bp
+    from src.routes.exports import exports_bp
+    from src.services.bundle_cache import clear_bundle_cache
+    from src.services.exposure import exposure_engine
+    from src.services.idempotency import idempotency_cache
+    from src.services.pricing import pricing_engine
+
+    connection = clone_template(target, seed)
+
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'test'
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'creator': lambda: connection,
+        'poolclass': StaticPool
+    }
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    app.register_blueprint(user_bp, url_prefix='/api')
+    app.register_blueprint(auth_bp, url_prefix='/api/auth')
+    app.register_blueprint(sports_bp, url_prefix='/api')
+    app.register_blueprint(betting_bp, url_prefix='/api')
+    app.register_blueprint(transactions_bp, url_prefix='/api')
+    app.register_blueprint(bundles_bp, url_prefix='/api')
+    app.register_blueprint(multibets_bp, url_prefix='/api')
+    app.register_blueprint(exports_bp, url_prefix='/api')
+
+    # The services keep process-wide in-memory state; start it over so nothing
+    # from a previous clone leaks into this one
+    clear_bundle_cache()
+    idempotency_cache.reset()
+    pricing_engine.reset()
+
+    db.init_app(app)
+    with app.app_context():
+        exposure_engine.rebuild()
+
+    return app
+
+if __name__ == '__main__':
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SEED
+    print(build_template(seed))
@@ -0,0 +1,195 @@
+import csv
+import io
+import json
+import zlib
+from flask import Blueprint, Response, jsonify, request, session, stream_with_context
+from src.models.user import db
+from src.models.betting import Event, BettingOption, Bet, MultiBet, MultiBetLeg, Transaction
+
+exports_bp = Blueprint('exports', __name__)
+
+# Full account statements, streamed in keyset batches. Rows are read as plain
+# tuples in id order (never ORM objects, so nothing accumulates in the session)
+# FETCH_SIZE at a time, each batch one short `WHERE id > :last ORDER BY id
+# LIMIT` query, and flushed in chunks of roughly FLUSH_BYTES, which keeps
+# memory flat however long the history is. The session is ended between
+# batches: a cursor left open for the whole download would hold SQLite's
+# SHARED lock and block every write until the client finished. Every row
+# carries its id, so an interrupted download resumes with ?after=<last id
+# received>.
+
+FETCH_SIZE = 1000
+FLUSH_BYTES = 64 * 1024
+
+TRANSACTION_COLUMNS = ['id', 'created_at', 'transaction_type', 'amount', 'description']
+BET_COLUMNS = [
+    'id', 'placed_at', 'home_team', 'away_team', 'option_type', 'option_value',
+    'amount', 'odds', 'potential_payout', 'status', 'settled_at'
+]
+MULTI_BET_COLUMNS = [
+    'id', 'placed_at', 'bet_type', 'system_size', 'combinations', 'legs', 'amount',
+    'unit_stake', 'combined_odds', 'potential_payout', 'payout', 'status', 'settled_at'
+]
+
+def transaction_rows(user_id, after, limit):
+    return db.session.execute(
+        db.select(
+            Transaction.id,
+            Transaction.created_at,
+            Transaction.transaction_type,
+            Transaction.amount,
+            Transaction.description
+        ).where(
+            Transaction.user_id == user_id,
+            Transaction.id > after
+        ).order_by(Transaction.id).limit(limit)
+    ).all()
+
+def bet_rows(user_id, after, limit):
+    return db.session.execute(
+        db.select(
+            Bet.id,
+            Bet.placed_at,
+            Event.home_team,
+            Event.away_team,
+            BettingOption.option_type,
+            BettingOption.option_value,
+            Bet.amount,
+            Bet.odds,
+            Bet.potential_payout,
+            Bet.status,
+            Bet.settled_at
+        ).join(
+            BettingOption, Bet.betting_option_id == BettingOption.id
+        ).join(
+            Event, BettingOption.event_id == Event.id
+        ).where(
+            Bet.user_id == user_id,
+            Bet.id > after
+        ).order_by(Bet.id).limit(limit)
+    ).all()
+
+def multi_bet_rows(user_id, after, limit):
+    legs = db.select(db.func.count(MultiBetLeg.id)).where(
+        MultiBetLeg.multi_bet_id == MultiBet.id
+    ).scalar_subquery()
+    return db.session.execute(
+        db.select(
+            MultiBet.id,
+            MultiBet.placed_at,
+            MultiBet.bet_type,
+            MultiBet.system_size,
+            MultiBet.combinations,
+            legs,
+            MultiBet.amount,
+            MultiBet.unit_stake,
+            MultiBet.combined_odds,
+            MultiBet.potential_payout,
+            MultiBet.payout,
+            MultiBet.status,
+            MultiBet.settled_at
+        ).where(
+            MultiBet.user_id == user_id,
+            MultiBet.id > after
+        ).order_by(MultiBet.id).limit(limit)
+    ).all()
+
+def keyset_rows(query_rows, user_id, after):
+    while True:
+        rows = query_rows(user_id, after, FETCH_SIZE)
+        db.session.remove()
+        yield from rows
+        if len(rows) < FETCH_SIZE:
+            return
+        after = rows[-1][0]
+
+def export_value(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+def encode_csv(columns, rows, header=True):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    for row in rows:
+        writer.writerow([export_value(value) for value in row])
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def encode_ndjson(columns, rows):
+    chunk = []
+    size = 0
+    for row in rows:
+        line = json.dumps(dict(zip(columns, map(export_value, row)))) + '\n'
+        chunk.append(line)
+        size += len(line)
+        if size >= FLUSH_BYTES:
+            yield ''.join(chunk)
+            chunk = []
+            size = 0
+    yield ''.join(chunk)
+
+def gzip_chunks(chunks):
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+def stream_export(name, columns, query_rows):
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    export_format = request.args.get('format', 'csv')
+    if export_format not in ('csv', 'ndjson'):
+        return jsonify({'error': 'Unsupported export format'}), 400
+
+    after = request.args.get('after', 0, type=int)
+    use_gzip = request.args.get('gzip', '0') in ('1', 'true')
+
+    rows = keyset_rows(query_rows, user_id, after)
+    if export_format == 'csv':
+        # A resumed download is appended to the partial file, which already
+        # starts with the header row
+        chunks = encode_csv(columns, rows, header=after == 0)
+    else:
+        chunks = encode_ndjson(columns, rows)
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    filename = f'{name}.{export_format}'
+
+    if use_gzip:
+        chunks = gzip_chunks(chunks)
+        mimetype = 'application/gzip'
+        filename += '.gz'
+
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+@exports_bp.route('/export/transactions', methods=['GET'])
+def export_transactions():
+    try:
+        return stream_export('transactions', TRANSACTION_COLUMNS, transaction_rows)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@exports_bp.route('/export/bets', methods=['GET'])
+def export_bets():
+    try:
+        return stream_export('bets', BET_COLUMNS, bet_rows)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@exports_bp.route('/export/multi-bets', methods=['GET'])
+def export_multi_bets():
+    try:
+        return stream_export('multi-bets', MULTI_BET_COLUMNS, multi_bet_rows)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,131 @@
+import threading
+from array import array
+from src.models.user import db
+from src.models.betting import BettingOption, Bet
+
+# In-memory liability book for pending single bets.
+#
+# Each event keeps one pair of parallel float arrays per market (option_type):
+# the total stake and the total potential payout on every option. Outcomes
+# within a market are mutually exclusive, so if option i wins the book pays
+# payouts[i] and keeps the whole market's stake. The worst case for a market
+# is therefore max(payouts) - sum(stakes), and for an event the sum over its
+# markets. Both are whole-array reductions, so evaluating an event never
+# touches the database or iterates bets.
+#
+# Multi bets (src.routes.multibets) are not in the book: a slip only pays when
+# several events resolve together, so its liability is not a per-option
+# amount. Adding its payout to every leg would count it once per leg and
+# overstate each market.
+
+class MarketBook:
+    __slots__ = ('option_ids', 'slots', 'stakes', 'payouts')
+
+    def __init__(self):
+        self.option_ids = []
+        self.slots = {}
+        self.stakes = array('d')
+        self.payouts = array('d')
+
+    def add(self, option_id, stake, payout):
+        slot = self.slots.get(option_id)
+        if slot is None:
+            slot = self.slots[option_id] = len(self.option_ids)
+            self.option_ids.append(option_id)
+            self.stakes.append(0.0)
+            self.payouts.append(0.0)
+        self.stakes[slot] += stake
+        self.payouts[slot] += payout
+
+    def worst_case(self):
+        # An outcome nobody backed pays out nothing, hence the floor at zero
+        return max(max(self.payouts), 0.0) - sum(self.stakes)
+
+class ExposureEngine:
+    def __init__(self):
+        self._events = {}
+        self._lock = threading.Lock()
+
+    def record_bet(self, event_id, option_id, market, stake, payout):
+        with self._lock:
+            markets = self._events.setdefault(event_id, {})
+            book = markets.get(market)
+            if book is None:
+                book = markets[market] = MarketBook()
+            book.add(option_id, stake, payout)
+
+    def clear_event(self, event_id):
+        # Settlement resolves every pending bet of an event at once
+        with self._lock:
+            self._events.pop(event_id, None)
+
+    def event_exposure(self, event_id):
+        with self._lock:
+            markets = self._events.get(event_id, {})
+            result = {
+                'event_id': event_id,
+                'total_staked': 0.0,
+                'worst_case_loss': 0.0,
+                'markets': []
+            }
+            for market, book in markets.items():
+                market_stake = sum(book.stakes)
+                result['total_staked'] += market_stake
+                result['worst_case_loss'] += book.worst_case()
+                result['markets'].append({
+                    'market': market,
+                    'total_staked': market_stake,
+                    'worst_case_loss': book.worst_case(),
+                    'options': [
+                        {
+                            'betting_option_id': option_id,
+                            'staked': book.stakes[slot],
+                            'liability': book.payouts[slot] - market_stake
+                        }
+                        for slot, option_id in enumerate(book.option_ids)
+                    ]
+                })
+            return result
+
+    def summary(self, limit=50):
+        with self._lock:
+            worst = [
+                (event_id, sum(book.worst_case() for book in markets.values()))
+                for event_id, markets in self._events.items()
+            ]
+        worst.sort(key=lambda item: item[1], reverse=True)
+        return [
+            {'event_id': event_id, 'worst_case_loss': loss}
+            for event_id, loss in worst[:limit]
+        ]
+
+    def rebuild(self):
+        # One grouped query over pending bets; call inside an app context
+        rows = db.session.query(
+            BettingOption.event_id,
+            BettingOption.option_type,
+            Bet.betting_option_id,
+            db.func.sum(Bet.amount),
+            db.func.sum(Bet.potential_payout)
+        ).join(
+            BettingOption, Bet.betting_option_id == BettingOption.id
+        ).filter(
+            Bet.status == 'pending'
+        ).group_by(
+            BettingOption.event_id,
+            BettingOption.option_type,
+            Bet.betting_option_id
+        ).all()
+
+        events = {}
+        for event_id, market, option_id, stake, payout in rows:
+            markets = events.setdefault(event_id, {})
+            book = markets.get(market)
+            if book is None:
+                book = markets[market] = MarketBook()
+            book.add(option_id, stake or 0.0, payout or 0.0)
+
+        with self._lock:
+            self._events = events
+
+exposure_engine = ExposureEngine()
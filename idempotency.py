@@ -0,0 +1,191 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import wraps
+from flask import Response, jsonify, make_response, request, session
+from sqlalchemy import inspect
+from src.models.user import db
+from src.models.betting import IdempotencyKey
+
+# Idempotency-Key support for money endpoints.
+#
+# The first request with a given (user, key) runs the view and stores its
+# response. Retries are answered from a bounded in-memory LRU, falling back to
+# the IdempotencyKey table, without touching User or Transaction. Duplicates
+# that arrive while the first request is still running in this process wait
+# for it and replay its response. A key reused with a different request body
+# or on a different endpoint is rejected with 422.
+#
+# The key row is added to the view's own session, so it commits atomically
+# with the balance change; a duplicate in another process then fails on the
+# unique constraint and replays instead. The row is committed with a NULL
+# status first and the response is written right after. A committed NULL row
+# therefore always means the money moved: if the response never gets stored
+# (the view failed after its commit, or the process died), the row is resolved
+# with RECOVERED_RESPONSE instead of blocking retries forever.
+#
+# Keys expire after KEY_TTL; expired rows are swept at most once per
+# SWEEP_INTERVAL so the table stays small.
+
+MAX_KEY_LENGTH = 64
+CACHE_SIZE = 10000
+IN_FLIGHT_TIMEOUT = 30  # seconds a duplicate waits for the first request
+KEY_TTL = timedelta(hours=24)
+SWEEP_INTERVAL = 600  # seconds
+
+RECOVERED_STATUS = 200
+RECOVERED_RESPONSE = '{"message": "Request was already processed; its original response is not available"}'
+
+class IdempotencyCache:
+    def __init__(self, max_size=CACHE_SIZE):
+        self.max_size = max_size
+        self._responses = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def claim(self, cache_key):
+        # Returns (stored response, None) for a finished request, or
+        # (None, True) once the caller owns the key and must run the view.
+        while True:
+            with self._lock:
+                entry = self._responses.get(cache_key)
+                if entry is not None:
+                    expires_at, stored = entry
+                    if expires_at > time.monotonic():
+                        self._responses.move_to_end(cache_key)
+                        return stored, None
+                    del self._responses[cache_key]
+                done = self._in_flight.get(cache_key)
+                if done is None:
+                    self._in_flight[cache_key] = threading.Event()
+                    return None, True
+            if not done.wait(IN_FLIGHT_TIMEOUT):
+                return None, False
+
+    def release(self, cache_key, stored=None):
+        with self._lock:
+            if stored is not None:
+                expires_at = time.monotonic() + KEY_TTL.total_seconds()
+                self._responses[cache_key] = (expires_at, stored)
+                self._responses.move_to_end(cache_key)
+                while len(self._responses) > self.max_size:
+                    self._responses.popitem(last=False)
+            done = self._in_flight.pop(cache_key, None)
+        if done is not None:
+            done.set()
+
+    def reset(self):
+        # Forget every stored response, e.g. when the app is bound to a new
+        # database. Requests still in flight keep their claims.
+        with self._lock:
+            self._responses.clear()
+
+idempotency_cache = IdempotencyCache()
+
+_last_sweep = 0.0
+_sweep_lock = threading.Lock()
+
+def sweep_expired_keys():
+    global _last_sweep
+    with _sweep_lock:
+        now = time.monotonic()
+        if now - _last_sweep < SWEEP_INTERVAL:
+            return
+        _last_sweep = now
+    IdempotencyKey.query.filter(
+        IdempotencyKey.created_at < datetime.utcnow() - KEY_TTL
+    ).delete(synchronize_session=False)
+    db.session.commit()
+
+def request_hash():
+    return hashlib.sha256(request.get_data()).hexdigest()
+
+def replay(stored):
+    endpoint, body_hash, status_code, body = stored
+    if endpoint != request.endpoint or body_hash != request_hash():
+        return jsonify({'error': 'Idempotency-Key was already used for a different request'}), 422
+    return Response(
+        body,
+        status=status_code,
+        mimetype='application/json',
+        headers={'Idempotent-Replayed': 'true'}
+    )
+
+def resolve(record, status_code, body):
+    stored = (record.endpoint, record.request_hash, status_code, body)
+    record.status_code = status_code
+    record.response = body
+    db.session.add(record)
+    db.session.commit()
+    return stored
+
+def load_stored(user_id, key):
+    record = IdempotencyKey.query.filter_by(user_id=user_id, key=key).first()
+    if record is None:
+        return None, None
+    if record.status_code is None:
+        if record.created_at < datetime.utcnow() - timedelta(seconds=IN_FLIGHT_TIMEOUT):
+            # Committed long ago without a response: the first request moved
+            # the money and then failed or died before storing its response
+            return resolve(record, RECOVERED_STATUS, RECOVERED_RESPONSE), record
+        return None, record
+    return (record.endpoint, record.request_hash, record.status_code, record.response), record
+
+def idempotent(view):
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get('Idempotency-Key')
+        user_id = session.get('user_id')
+        if not key or not user_id:
+            return view(*args, **kwargs)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return jsonify({'error': 'Idempotency-Key is too long'}), 400
+
+        cache_key = (user_id, key)
+        stored, owner = idempotency_cache.claim(cache_key)
+        if stored is not None:
+            return replay(stored)
+        if not owner:
+            return jsonify({'error': 'A request with this Idempotency-Key is still in progress'}), 409
+
+        stored = None
+        try:
+            sweep_expired_keys()
+
+            stored, record = load_stored(user_id, key)
+            if stored is not None:
+                return replay(stored)
+            if record is not None:
+                return jsonify({'error': 'A request with this Idempotency-Key is still in progress'}), 409
+
+            body_hash = request_hash()
+            record = IdempotencyKey(
+                user_id=user_id, key=key, endpoint=request.endpoint, request_hash=body_hash
+            )
+            db.session.add(record)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code >= 500:
+                db.session.rollback()
+                if inspect(record).persistent:
+                    # The view committed, so the money moved, and then failed.
+                    # Retries must not run it again.
+                    stored = resolve(record, RECOVERED_STATUS, RECOVERED_RESPONSE)
+                    return response
+                # Nothing was written, so the client may retry. The failure
+                # may also be a duplicate from another process losing the
+                # race on the unique key; replay the winner if so.
+                stored, record = load_stored(user_id, key)
+                if stored is not None:
+                    return replay(stored)
+                return response
+
+            stored = resolve(record, response.status_code, response.get_data(as_text=True))
+            return response
+        finally:
+            idempotency_cache.release(cache_key, stored)
+
+    return wrapper
@@ -9,8 +9,13 @@ from src.models.user import db
 from src.routes.user import user_bp
 from src.routes.auth import auth_bp
 from src.routes.sports import sports_bp
-from src.routes.betting import betting_bp
+from src.routes.bets import betting_bp
 from src.routes.transactions import transactions_bp
+from src.routes.bundles import bundles_bp
+from src.routes.multibets import multibets_bp
+from src.routes.exports import exports_bp
+from src.services.exposure import exposure_engine
+from src.services.pricing import pricing_engine
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
@@ -24,6 +29,9 @@ app.register_blueprint(auth_bp, url_prefix='/api/auth')
 app.register_blueprint(sports_bp, url_prefix='/api')
 app.register_blueprint(betting_bp, url_prefix='/api')
 app.register_blueprint(transactions_bp, url_prefix='/api')
+app.register_blueprint(bundles_bp, url_prefix='/api')
+app.register_blueprint(multibets_bp, url_prefix='/api')
+app.register_blueprint(exports_bp, url_prefix='/api')
 
 # Database configuration
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
@@ -31,10 +39,15 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db.init_app(app)
 
 # Import all models to ensure they are registered
-from src.models.betting import Sport, Event, BettingOption, Bet, Transaction
+from src.models.betting import Sport, Event, BettingOption, Bet, MultiBet, MultiBetLeg, BetStats, Transaction, IdempotencyKey
 
 with app.app_context():
     db.create_all()
+    exposure_engine.rebuild()
+
+# Reprice odds from placed-bet flow on a fixed tick
+pricing_engine.interval = float(os.environ.get('ODDS_REPRICING_INTERVAL', 5))
+pricing_engine.start(app)
 
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
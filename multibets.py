@@ -0,0 +1,259 @@
+from flask import Blueprint, jsonify, request, session
+from sqlalchemy.orm import selectinload
+from src.models.user import User, db
+from src.models.betting import BettingOption, MultiBet, MultiBetLeg, Transaction
+from src.services.bet_stats import load_bet_stats, bump_bet_stats
+from src.services.pricing import pricing_engine
+from src.services.idempotency import idempotent
+from datetime import datetime
+from math import comb
+
+multibets_bp = Blueprint('multibets', __name__)
+
+MAX_LEGS = 20
+
+def combination_odds(leg_odds, k):
+    # Sum over every k-leg combination of the product of its odds, i.e. the
+    # k-th elementary symmetric polynomial. Built up leg by leg in O(n * k)
+    # rather than enumerating all C(n, k) combinations.
+    totals = [1.0] + [0.0] * k
+    for n, odds in enumerate(leg_odds, start=1):
+        for j in range(min(n, k), 0, -1):
+            totals[j] += totals[j - 1] * odds
+    return totals[k]
+
+def effective_odds(leg):
+    # A lost leg zeroes every combination it is in, a void leg counts as 1.0
+    if leg.status == 'lost':
+        return 0.0
+    if leg.status == 'void':
+        return 1.0
+    return leg.odds
+
+def settle_multi_bet_legs(event_id, winning_option_ids, cancelled=False):
+    # Resolves every pending leg on the event in bulk, then settles the
+    # multi bets that can no longer change. Called from settle_event before
+    # it commits.
+    event_option_ids = db.session.query(BettingOption.id).filter(
+        BettingOption.event_id == event_id
+    ).scalar_subquery()
+
+    affected_ids = [row[0] for row in db.session.query(MultiBetLeg.multi_bet_id).filter(
+        MultiBetLeg.betting_option_id.in_(event_option_ids),
+        MultiBetLeg.status == 'pending'
+    ).distinct().all()]
+    if not affected_ids:
+        return 0
+
+    pending_legs = MultiBetLeg.query.filter(
+        MultiBetLeg.betting_option_id.in_(event_option_ids),
+        MultiBetLeg.status == 'pending'
+    )
+    if cancelled:
+        pending_legs.update({MultiBetLeg.status: 'void'}, synchronize_session=False)
+    else:
+        winners = list(winning_option_ids)
+        pending_legs.filter(MultiBetLeg.betting_option_id.in_(winners)).update(
+            {MultiBetLeg.status: 'won'}, synchronize_session=False
+        )
+        MultiBetLeg.query.filter(
+            MultiBetLeg.betting_option_id.in_(event_option_ids),
+            MultiBetLeg.status == 'pending',
+            MultiBetLeg.betting_option_id.notin_(winners)
+        ).update({MultiBetLeg.status: 'lost'}, synchronize_session=False)
+
+    multi_bets = MultiBet.query.options(
+        selectinload(MultiBet.legs)
+    ).filter(
+        MultiBet.id.in_(affected_ids),
+        MultiBet.status == 'pending'
+    ).populate_existing().all()
+
+    # Rollups must exist before any slip changes status
+    for user_id in {multi_bet.user_id for multi_bet in multi_bets}:
+        load_bet_stats(user_id)
+
+    now = datetime.utcnow()
+    settled = 0
+    for multi_bet in multi_bets:
+        legs = multi_bet.legs
+        best_case = multi_bet.unit_stake * combination_odds(
+            [effective_odds(leg) for leg in legs], multi_bet.system_size
+        )
+        if any(leg.status == 'pending' for leg in legs) and best_case > 0:
+            continue
+
+        payout = round(best_case, 2)
+        if all(leg.status == 'void' for leg in legs):
+            multi_bet.status = 'cancelled'
+            bump_bet_stats(
+                multi_bet.user_id, pending_bets=-1, cancelled_bets=1,
+                total_staked=-multi_bet.amount
+            )
+        elif payout > 0:
+            multi_bet.status = 'won'
+            bump_bet_stats(
+                multi_bet.user_id, biggest_win=payout, pending_bets=-1, won_bets=1,
+                total_returned=payout
+            )
+        else:
+            multi_bet.status = 'lost'
+            bump_bet_stats(multi_bet.user_id, pending_bets=-1, lost_bets=1)
+        multi_bet.payout = payout
+        multi_bet.settled_at = now
+        settled += 1
+
+        if payout > 0:
+            User.query.filter_by(id=multi_bet.user_id).update(
+                {User.balance: User.balance + payout},
+                synchronize_session=False
+            )
+            db.session.add(Transaction(
+                user_id=multi_bet.user_id,
+                transaction_type='payout',
+                amount=payout,
+                description=f'Payout for {multi_bet.bet_type} bet #{multi_bet.id}'
+            ))
+
+    return settled
+
+@multibets_bp.route('/place-multi-bet', methods=['POST'])
+@idempotent
+def place_multi_bet():
+    try:
+        user_id = session.get('user_id')
+        if not user_id:
+            return jsonify({'error': 'Not authenticated'}), 401
+
+        data = request.json
+        amount = float(data['amount'])
+        option_ids = data['betting_option_ids']
+        legs_count = len(option_ids)
+        system_size = int(data.get('system_size', legs_count))
+
+        if amount <= 0:
+            return jsonify({'error': 'Invalid bet amount'}), 400
+
+        if legs_count < 2 or legs_count > MAX_LEGS or len(set(option_ids)) != legs_count:
+            return jsonify({'error': f'A multi bet needs 2 to {MAX_LEGS} distinct selections'}), 400
+
+        if system_size < 1 or system_size > legs_count:
+            return jsonify({'error': 'Invalid system size'}), 400
+
+        expected_odds = data.get('odds')
+        if expected_odds is not None and len(expected_odds) != legs_count:
+            return jsonify({'error': 'Expected odds must match the selections'}), 400
+
+        options = BettingOption.query.options(
+            selectinload(BettingOption.event)
+        ).filter(BettingOption.id.in_(option_ids)).all()
+
+        if len(options) != legs_count or not all(option.is_active for option in options):
+            return jsonify({'error': 'Betting option not available'}), 400
+
+        if any(option.event.status not in ('upcoming', 'live') for option in options):
+            return jsonify({'error': 'Event is closed for betting'}), 400
+
+        # Legs on the same event are correlated and can't be combined
+        if len({option.event_id for option in options}) != legs_count:
+            return jsonify({'error': 'Only one selection per event is allowed'}), 400
+
+        # Odds move on every repricing tick; never settle at prices the client
+        # didn't show
+        if expected_odds is not None:
+            expected = dict(zip(option_ids, expected_odds))
+            current = {option.id: option.odds for option in options}
+            if any(round(float(expected[option_id]), 2) != odds for option_id, odds in current.items()):
+                return jsonify({'error': 'Odds changed', 'odds': current}), 409
+
+        user = User.query.get(user_id)
+        if not user:
+            return jsonify({'error': 'User not found'}), 404
+
+        if user.balance < amount:
+            return jsonify({'error': 'Insufficient balance'}), 400
+
+        # Make sure the rollup exists before the slip is added, so a
+        # first-time rebuild doesn't count it twice
+        load_bet_stats(user_id)
+
+        user.balance -= amount
+
+        combinations = comb(legs_count, system_size)
+        unit_stake = amount / combinations
+        potential_payout = round(unit_stake * combination_odds(
+            [option.odds for option in options], system_size
+        ), 2)
+
+        multi_bet = MultiBet(
+            user_id=user_id,
+            bet_type='accumulator' if system_size == legs_count else 'system',
+            system_size=system_size,
+            combinations=combinations,
+            amount=amount,
+            unit_stake=unit_stake,
+            combined_odds=round(potential_payout / amount, 2),
+            potential_payout=potential_payout
+        )
+        multi_bet.legs = [
+            MultiBetLeg(betting_option_id=option.id, odds=option.odds)
+            for option in options
+        ]
+
+        transaction = Transaction(
+            user_id=user_id,
+            transaction_type='bet',
+            amount=-amount,
+            description=f'{multi_bet.bet_type.capitalize()} bet with {legs_count} selections'
+        )
+
+        legs_flow = [(option.event_id, option.id) for option in options]
+
+        db.session.add(multi_bet)
+        db.session.add(transaction)
+        bump_bet_stats(user_id, total_bets=1, pending_bets=1, total_staked=amount)
+        db.session.commit()
+
+        # The whole stake rides on every leg, so each leg's market sees it
+        for event_id, option_id in legs_flow:
+            pricing_engine.record_bet(event_id, option_id, amount)
+
+        multi_bet_data = multi_bet.to_dict()
+        multi_bet_data['legs'] = [leg.to_dict() for leg in multi_bet.legs]
+
+        return jsonify({
+            'message': 'Bet placed successfully',
+            'new_balance': user.balance,
+            'multi_bet': multi_bet_data
+        }), 201
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@multibets_bp.route('/my-multi-bets', methods=['GET'])
+def get_my_multi_bets():
+    try:
+        user_id = session.get('user_id')
+        if not user_id:
+            return jsonify({'error': 'Not authenticated'}), 401
+
+        limit = min(request.args.get('limit', 50, type=int), 100)
+        before_id = request.args.get('before_id', type=int)
+
+        query = MultiBet.query.options(
+            selectinload(MultiBet.legs)
+        ).filter(MultiBet.user_id == user_id)
+        if before_id is not None:
+            query = query.filter(MultiBet.id < before_id)
+
+        multi_bets = []
+        for multi_bet in query.order_by(MultiBet.id.desc()).limit(limit).all():
+            multi_bet_data = multi_bet.to_dict()
+            multi_bet_data['legs'] = [leg.to_dict() for leg in multi_bet.legs]
+            multi_bets.append(multi_bet_data)
+
+        return jsonify(multi_bets), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,151 @@
+import threading
+import time
+from array import array
+from src.models.user import db
+from src.models.betting import BettingOption
+
+# Flow-driven repricing.
+#
+# Placed bets only add their stake to an in-memory per-option counter. On each
+# tick every market (event, option_type) that took money since the previous
+# tick is repriced in one pass:
+#
+#   q_i  = (1 / odds_i) / sum_j(1 / odds_j)      current fair probabilities
+#   f_i  = stake_i / S                            share of the new flow
+#   w    = SENSITIVITY * S / (S + LIQUIDITY)      how far the flow may move q
+#   q'_i = (1 - w) * q_i + w * f_i
+#   odds'_i = 1 / (q'_i * (1 + TARGET_MARGIN))
+#
+# so the book's overround is reset to the target margin on every reprice.
+# Markets that took no stake since the last tick keep their prices, even when
+# another market of the same event is repriced. All options of all dirty
+# markets are laid out in flat arrays with per-market offsets, and the changed
+# prices are written back in a single batched UPDATE.
+
+TARGET_MARGIN = 0.05
+SENSITIVITY = 0.5
+LIQUIDITY = 1000.0
+MIN_ODDS = 1.01
+
+def reprice(odds, stakes, offsets):
+    # odds/stakes are flat per-option arrays; market k spans
+    # offsets[k]:offsets[k + 1]. Returns the new odds in the same layout.
+    implied = [1.0 / o for o in odds]
+    new_odds = array('d', odds)
+    scale = 1.0 + TARGET_MARGIN
+    for k in range(len(offsets) - 1):
+        start, end = offsets[k], offsets[k + 1]
+        if end - start < 2:
+            continue  # nothing to balance a single-option market against
+        book = sum(implied[start:end])
+        flow = sum(stakes[start:end])
+        weight = SENSITIVITY * flow / (flow + LIQUIDITY) if flow > 0 else 0.0
+        keep = (1.0 - weight) / book
+        share = weight / flow if flow > 0 else 0.0
+        new_odds[start:end] = array('d', [
+            max(MIN_ODDS, round(1.0 / ((keep * p + share * s) * scale), 2))
+            for p, s in zip(implied[start:end], stakes[start:end])
+        ])
+    return new_odds
+
+class PricingEngine:
+    def __init__(self, interval=5.0):
+        self.interval = interval
+        self._flow = {}  # event_id -> {option_id: stake since last tick}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def record_bet(self, event_id, option_id, stake):
+        with self._lock:
+            options = self._flow.setdefault(event_id, {})
+            options[option_id] = options.get(option_id, 0.0) + stake
+
+    def clear_event(self, event_id):
+        with self._lock:
+            self._flow.pop(event_id, None)
+
+    def reset(self):
+        # Drop all unpriced flow, e.g. when the app is bound to a new database
+        with self._lock:
+            self._flow = {}
+
+    def tick(self):
+        # Call inside an app context; returns the number of repriced options
+        with self._lock:
+            flow, self._flow = self._flow, {}
+        if not flow:
+            return 0
+
+        try:
+            return self._reprice(flow)
+        except Exception:
+            # Put the flow back so the next tick retries it, merged with
+            # whatever arrived in the meantime
+            with self._lock:
+                for event_id, options in flow.items():
+                    pending = self._flow.setdefault(event_id, {})
+                    for option_id, stake in options.items():
+                        pending[option_id] = pending.get(option_id, 0.0) + stake
+            raise
+
+    def _reprice(self, flow):
+        options = BettingOption.query.filter(
+            BettingOption.event_id.in_(list(flow)),
+            BettingOption.is_active == True
+        ).order_by(
+            BettingOption.event_id,
+            BettingOption.option_type,
+            BettingOption.id
+        ).all()
+
+        staked_markets = {
+            (option.event_id, option.option_type)
+            for option in options
+            if flow[option.event_id].get(option.id)
+        }
+
+        ids, odds, stakes, offsets = [], array('d'), array('d'), [0]
+        market = None
+        for option in options:
+            if (option.event_id, option.option_type) not in staked_markets:
+                continue
+            if (option.event_id, option.option_type) != market:
+                if ids:
+                    offsets.append(len(ids))
+                market = (option.event_id, option.option_type)
+            ids.append(option.id)
+            odds.append(option.odds)
+            stakes.append(flow[option.event_id].get(option.id, 0.0))
+        if not ids:
+            return 0
+        offsets.append(len(ids))
+
+        new_odds = reprice(odds, stakes, offsets)
+        changed = [
+            {'id': option_id, 'odds': price}
+            for option_id, old, price in zip(ids, odds, new_odds)
+            if price != old
+        ]
+        if changed:
+            db.session.bulk_update_mappings(BettingOption, changed)
+            db.session.commit()
+        return len(changed)
+
+    def start(self, app):
+        if self._thread is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(self.interval)
+                with app.app_context():
+                    try:
+                        self.tick()
+                    except Exception:
+                        db.session.rollback()
+                        app.logger.exception('Odds repricing tick failed')
+
+        self._thread = threading.Thread(target=run, name='odds-repricing', daemon=True)
+        self._thread.start()
+
+pricing_engine = PricingEngine()
@@ -1,14 +1,40 @@
 from flask import Blueprint, jsonify, request
+from sqlalchemy.orm import joinedload
 from src.models.betting import Sport, Event, BettingOption, db
+from src.services.bundle_cache import clear_bundle_cache
 from datetime import datetime, timedelta
 
 sports_bp = Blueprint('sports', __name__)
 
+# Shared queries, also used by the page bundles in src.routes.bundles.
+# Event.to_dict() reads event.sport, so the sport is joined up front instead
+# of being lazy-loaded once per event.
+
+def list_active_sports():
+    sports = Sport.query.filter_by(is_active=True).all()
+    return [sport.to_dict() for sport in sports]
+
+def list_events(status='upcoming', limit=50):
+    events = Event.query.options(joinedload(Event.sport)).filter_by(status=status).limit(limit).all()
+    return [event.to_dict() for event in events]
+
+def list_live_events():
+    events = Event.query.options(joinedload(Event.sport)).filter_by(status='live').all()
+    return [event.to_dict() for event in events]
+
+def list_popular_events():
+    # Get events starting in the next 24 hours
+    tomorrow = datetime.utcnow() + timedelta(days=1)
+    events = Event.query.options(joinedload(Event.sport)).filter(
+        Event.start_time <= tomorrow,
+        Event.status == 'upcoming'
+    ).limit(10).all()
+    return [event.to_dict() for event in events]
+
 @sports_bp.route('/sports', methods=['GET'])
 def get_sports():
     try:
-        sports = Sport.query.filter_by(is_active=True).all()
-        return jsonify([sport.to_dict() for sport in sports]), 200
+        return jsonify(list_active_sports()), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -27,8 +53,7 @@ def get_events():
         status = request.args.get('status', 'upcoming')
         limit = request.args.get('limit', 50, type=int)
         
-        events = Event.query.filter_by(status=status).limit(limit).all()
-        return jsonify([event.to_dict() for event in events]), 200
+        return jsonify(list_events(status, limit)), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -48,22 +73,14 @@ def get_event(event_id):
 @sports_bp.route('/events/live', methods=['GET'])
 def get_live_events():
     try:
-        events = Event.query.filter_by(status='live').all()
-        return jsonify([event.to_dict() for event in events]), 200
+        return jsonify(list_live_events()), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @sports_bp.route('/events/popular', methods=['GET'])
 def get_popular_events():
     try:
-        # Get events starting in the next 24 hours
-        tomorrow = datetime.utcnow() + timedelta(days=1)
-        events = Event.query.filter(
-            Event.start_time <= tomorrow,
-            Event.status == 'upcoming'
-        ).limit(10).all()
-        
-        return jsonify([event.to_dict() for event in events]), 200
+        return jsonify(list_popular_events()), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -79,6 +96,7 @@ def create_sport():
         )
         db.session.add(sport)
         db.session.commit()
+        clear_bundle_cache()
         return jsonify(sport.to_dict()), 201
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -108,6 +126,7 @@ def create_event():
             db.session.add(option)
         
         db.session.commit()
+        clear_bundle_cache()
         
         return jsonify(event.to_dict()), 201
     except Exception as e:
@@ -1,11 +1,59 @@
 from flask import Blueprint, jsonify, request, session
 from src.models.user import User, db
 from src.models.betting import Transaction
+from src.services.idempotency import idempotent
 from datetime import datetime
 
 transactions_bp = Blueprint('transactions', __name__)
 
+# Shared queries, also used by the page bundles in src.routes.bundles.
+
+def build_transaction_page(user_id, page=1, per_page=20, transaction_type=None):
+    query = Transaction.query.filter_by(user_id=user_id)
+    
+    if transaction_type:
+        query = query.filter_by(transaction_type=transaction_type)
+    
+    transactions = query.order_by(
+        Transaction.created_at.desc()
+    ).paginate(
+        page=page, 
+        per_page=per_page, 
+        error_out=False
+    )
+    
+    return {
+        'transactions': [transaction.to_dict() for transaction in transactions.items],
+        'total': transactions.total,
+        'pages': transactions.pages,
+        'current_page': page
+    }
+
+def build_wallet_summary(user):
+    # One grouped scan instead of a separate SUM per transaction type
+    totals = dict(db.session.query(
+        Transaction.transaction_type,
+        db.func.sum(Transaction.amount)
+    ).filter(
+        Transaction.user_id == user.id
+    ).group_by(Transaction.transaction_type).all())
+    
+    total_deposits = totals.get('deposit') or 0
+    total_withdrawals = abs(totals.get('withdrawal') or 0)
+    total_bets = abs(totals.get('bet') or 0)
+    total_payouts = totals.get('payout') or 0
+    
+    return {
+        'current_balance': user.balance,
+        'total_deposits': total_deposits,
+        'total_withdrawals': total_withdrawals,
+        'total_bets': total_bets,
+        'total_payouts': total_payouts,
+        'net_profit': total_payouts - total_bets
+    }
+
 @transactions_bp.route('/deposit', methods=['POST'])
+@idempotent
 def deposit():
     try:
         user_id = session.get('user_id')
@@ -49,6 +97,7 @@ def deposit():
         return jsonify({'error': str(e)}), 500
 
 @transactions_bp.route('/withdraw', methods=['POST'])
+@idempotent
 def withdraw():
     try:
         user_id = session.get('user_id')
@@ -105,25 +154,7 @@ def get_transaction_history():
         per_page = request.args.get('per_page', 20, type=int)
         transaction_type = request.args.get('type')
         
-        query = Transaction.query.filter_by(user_id=user_id)
-        
-        if transaction_type:
-            query = query.filter_by(transaction_type=transaction_type)
-        
-        transactions = query.order_by(
-            Transaction.created_at.desc()
-        ).paginate(
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
-        
-        return jsonify({
-            'transactions': [transaction.to_dict() for transaction in transactions.items],
-            'total': transactions.total,
-            'pages': transactions.pages,
-            'current_page': page
-        }), 200
+        return jsonify(build_transaction_page(user_id, page, per_page, transaction_type)), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -139,35 +170,7 @@ def get_wallet_summary():
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        # Calculate summary statistics
-        total_deposits = db.session.query(db.func.sum(Transaction.amount)).filter(
-            Transaction.user_id == user_id,
-            Transaction.transaction_type == 'deposit'
-        ).scalar() or 0
-        
-        total_withdrawals = abs(db.session.query(db.func.sum(Transaction.amount)).filter(
-            Transaction.user_id == user_id,
-            Transaction.transaction_type == 'withdrawal'
-        ).scalar() or 0)
-        
-        total_bets = abs(db.session.query(db.func.sum(Transaction.amount)).filter(
-            Transaction.user_id == user_id,
-            Transaction.transaction_type == 'bet'
-        ).scalar() or 0)
-        
-        total_payouts = db.session.query(db.func.sum(Transaction.amount)).filter(
-            Transaction.user_id == user_id,
-            Transaction.transaction_type == 'payout'
-        ).scalar() or 0
-        
-        return jsonify({
-            'current_balance': user.balance,
-            'total_deposits': total_deposits,
-            'total_withdrawals': total_withdrawals,
-            'total_bets': total_bets,
-            'total_payouts': total_payouts,
-            'net_profit': total_payouts - total_bets
-        }), 200
+        return jsonify(build_wallet_summary(user)), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500